@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from typing import Any
 
@@ -17,6 +18,27 @@ logger = logging.getLogger(__name__)
 _PROMPT_DIRNAME = "prompts"
 
 
+@functools.cache
+def _prompt_environment() -> Environment:
+    """Build the prompt Jinja env once; templates are compiled on first use.
+
+    Prompt and skill files ship with the package, so ``auto_reload`` is off
+    and every agent spawn reuses the compiled ``system_prompt.jinja``.
+    Per-render values (including ``get_skill``) are passed as render
+    context, never set on the shared env.
+    """
+    prompt_dir = get_strix_resource_path("agents", _PROMPT_DIRNAME)
+    skills_dir = get_strix_resource_path("skills")
+    return Environment(
+        loader=FileSystemLoader([prompt_dir, skills_dir]),
+        autoescape=select_autoescape(
+            enabled_extensions=(),
+            default_for_string=False,
+        ),
+        auto_reload=False,
+    )
+
+
 def _resolve_skills(
     *,
     requested: list[str] | None,
@@ -68,16 +90,6 @@ def render_system_prompt(
 ) -> str:
     """Render the system prompt. Returns empty string on template failure."""
     try:
-        prompt_dir = get_strix_resource_path("agents", _PROMPT_DIRNAME)
-        skills_dir = get_strix_resource_path("skills")
-        env = Environment(
-            loader=FileSystemLoader([prompt_dir, skills_dir]),
-            autoescape=select_autoescape(
-                enabled_extensions=(),
-                default_for_string=False,
-            ),
-        )
-
         skills_to_load = _resolve_skills(
             requested=skills,
             scan_mode=scan_mode,
@@ -85,9 +97,10 @@ def render_system_prompt(
             is_root=is_root,
         )
         skill_content = load_skills(skills_to_load)
-        env.globals["get_skill"] = lambda name: skill_content.get(name, "")
 
-        rendered = env.get_template("system_prompt.jinja").render(
+        template = _prompt_environment().get_template("system_prompt.jinja")
+        rendered = template.render(
+            get_skill=lambda name: skill_content.get(name, ""),
             loaded_skill_names=list(skill_content.keys()),
             available_skills=get_available_skills(),
             interactive=interactive,
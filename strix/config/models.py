@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from typing import TYPE_CHECKING
 
@@ -60,8 +61,20 @@ DEFAULT_MODEL_RETRY = ModelRetrySettings(
 )
 
 
+# ``load_settings()`` memoizes one Settings object (replaced on config
+# override), so identity tells us whether the SDK/LiteLLM globals are current.
+_configured_settings: Settings | None = None
+
+
 def configure_sdk_model_defaults(settings: Settings) -> None:
-    """Apply Strix config to SDK-native defaults."""
+    """Apply Strix config to SDK-native defaults.
+
+    Repeat calls with the same settings object are no-ops; the dedupe check
+    calls this once per reported finding.
+    """
+    global _configured_settings  # noqa: PLW0603
+    if settings is _configured_settings:
+        return
     llm = settings.llm
     set_tracing_disabled(True)
     _configure_litellm_compatibility()
@@ -75,6 +88,7 @@ def configure_sdk_model_defaults(settings: Settings) -> None:
         set_default_openai_api("chat_completions")
     else:
         set_default_openai_api("responses")
+    _configured_settings = settings
 
 
 def _mirror_api_key_to_provider_env(model_name: str | None, api_key: str) -> None:
@@ -140,6 +154,9 @@ def uses_chat_completions_tool_schema(model_name: str, settings: Settings) -> bo
     return not model_supports_reasoning(model_name)
 
 
+# Both lookups below normalize the name and probe LiteLLM's ~2k-entry
+# model_cost table; the answer is fixed for a given name within a process.
+@functools.lru_cache(maxsize=64)
 def model_supports_reasoning(model_name: str) -> bool:
     import litellm
 
@@ -154,6 +171,7 @@ def model_supports_reasoning(model_name: str) -> bool:
     return bool(entry and entry.get("supports_reasoning"))
 
 
+@functools.lru_cache(maxsize=64)
 def is_known_openai_bare_model(model_name: str) -> bool:
     import litellm
 
@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import AliasChoices, Field
+from pydantic import AliasChoices, BeforeValidator, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 ReasoningEffort = Literal["none", "minimal", "low", "medium", "high", "xhigh"]
 
+
+def _strip_or_none(value: Any) -> Any:
+    if isinstance(value, str):
+        return value.strip() or None
+    return value
+
+
+# Env/JSON strings are normalized once at load so call sites can rely on
+# "falsy means unset" instead of re-stripping on every read.
+OptionalStr = Annotated[str | None, BeforeValidator(_strip_or_none)]
+
 _BASE_CONFIG = SettingsConfigDict(
     case_sensitive=False,
     populate_by_name=True,
@@ -20,12 +31,12 @@ _BASE_CONFIG = SettingsConfigDict(
 class LlmSettings(BaseSettings):
     model_config = _BASE_CONFIG
 
-    model: str | None = Field(default=None, alias="STRIX_LLM")
-    api_key: str | None = Field(
+    model: OptionalStr = Field(default=None, alias="STRIX_LLM")
+    api_key: OptionalStr = Field(
         default=None,
         validation_alias=AliasChoices("LLM_API_KEY", "OPENAI_API_KEY"),
     )
-    api_base: str | None = Field(
+    api_base: OptionalStr = Field(
         default=None,
         validation_alias=AliasChoices(
             "LLM_API_BASE",
@@ -63,7 +74,7 @@ class TelemetrySettings(BaseSettings):
 class IntegrationSettings(BaseSettings):
     model_config = _BASE_CONFIG
 
-    perplexity_api_key: str | None = Field(default=None, alias="PERPLEXITY_API_KEY")
+    perplexity_api_key: OptionalStr = Field(default=None, alias="PERPLEXITY_API_KEY")
 
 
 class Settings(BaseSettings):
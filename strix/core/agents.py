@@ -42,11 +42,13 @@ class AgentCoordinator:
         self.runtimes: dict[str, AgentRuntime] = {}
         self._lock = asyncio.Lock()
         self._snapshot_path: Path | None = None
+        self._last_snapshot_payload: str | None = None
         self.is_shutting_down = False
         self._budget_stopped = False
 
     def set_snapshot_path(self, path: Path) -> None:
         self._snapshot_path = path
+        self._last_snapshot_payload = None
 
     def mark_shutting_down(self) -> None:
         self.is_shutting_down = True
@@ -80,7 +82,7 @@ class AgentCoordinator:
                 "task": task or "",
                 "skills": list(skills or []),
             }
-            self.runtimes.setdefault(agent_id, AgentRuntime())
+            self._runtime_locked(agent_id)
         logger.info("agent.register %s (%s) parent=%s", agent_id, name, parent_id or "-")
         await self._maybe_snapshot()
 
@@ -93,7 +95,7 @@ class AgentCoordinator:
         interrupt_on_message: bool | None = None,
     ) -> None:
         async with self._lock:
-            runtime = self.runtimes.setdefault(agent_id, AgentRuntime())
+            runtime = self._runtime_locked(agent_id)
             if session is not None:
                 runtime.session = session
             if task is not None:
@@ -115,7 +117,7 @@ class AgentCoordinator:
             if agent_id not in self.statuses:
                 return
             self.statuses[agent_id] = status  # type: ignore[assignment]
-            runtime = self.runtimes.setdefault(agent_id, AgentRuntime())
+            runtime = self._runtime_locked(agent_id)
             runtime.wake.set()
         logger.info("agent.status %s=%s", agent_id, status)
         await self._maybe_snapshot()
@@ -126,7 +128,7 @@ class AgentCoordinator:
             if target_agent_id not in self.statuses:
                 logger.debug("agent.send dropped unknown target=%s", target_agent_id)
                 return False
-            runtime = self.runtimes.setdefault(target_agent_id, AgentRuntime())
+            runtime = self._runtime_locked(target_agent_id)
             session = runtime.session
             stream = runtime.stream
             interrupt = runtime.interrupt_on_message
@@ -146,7 +148,7 @@ class AgentCoordinator:
             return False
         async with self._lock:
             self.pending_counts[target_agent_id] = self.pending_counts.get(target_agent_id, 0) + 1
-            self.runtimes.setdefault(target_agent_id, AgentRuntime()).wake.set()
+            self._runtime_locked(target_agent_id).wake.set()
         if stream is not None and interrupt:
             stream.cancel(mode="immediate")
         await self._maybe_snapshot()
@@ -157,7 +159,7 @@ class AgentCoordinator:
             async with self._lock:
                 if self._budget_stopped or self.pending_counts.get(agent_id, 0) > 0:
                     return
-                wake = self.runtimes.setdefault(agent_id, AgentRuntime()).wake
+                wake = self._runtime_locked(agent_id).wake
                 wake.clear()
             await wake.wait()
 
@@ -170,7 +172,8 @@ class AgentCoordinator:
         async with self._lock:
             count = self.pending_counts.get(agent_id, 0)
             self.pending_counts[agent_id] = 0
-            session = self.runtimes.get(agent_id, AgentRuntime()).session
+            runtime = self.runtimes.get(agent_id)
+            session = runtime.session if runtime is not None else None
         if count <= 0:
             return 0, []
         await self._maybe_snapshot()
@@ -183,10 +186,7 @@ class AgentCoordinator:
         async with self._lock:
             if agent_id not in self.statuses:
                 return
-            self.statuses[agent_id] = "stopped"
-            runtime = self.runtimes.setdefault(agent_id, AgentRuntime())
-            runtime.wake.set()
-            stream = runtime.stream
+            stream = self._mark_stopped_locked(agent_id)
         if stream is not None:
             stream.cancel(mode="after_turn")
         await self._maybe_snapshot()
@@ -195,7 +195,8 @@ class AgentCoordinator:
         tasks = []
         async with self._lock:
             for aid in reversed(self._subtree_order_locked(agent_id)):
-                task = self.runtimes.get(aid, AgentRuntime()).task
+                runtime = self.runtimes.get(aid)
+                task = runtime.task if runtime is not None else None
                 if task is not None and not task.done():
                     tasks.append(task)
         for task in tasks:
@@ -204,10 +205,18 @@ class AgentCoordinator:
             await asyncio.gather(*tasks, return_exceptions=True)
 
     async def cancel_descendants_graceful(self, agent_id: str) -> None:
+        # Flip the whole subtree in one critical section and persist once,
+        # rather than a lock round-trip plus snapshot write per agent.
+        streams: list[Any] = []
         async with self._lock:
-            order = self._subtree_order_locked(agent_id)
-        for aid in reversed(order):
-            await self.request_stop(aid)
+            for aid in reversed(self._subtree_order_locked(agent_id)):
+                if aid not in self.statuses:
+                    continue
+                stream = self._mark_stopped_locked(aid)
+                if stream is not None:
+                    streams.append(stream)
+        for stream in streams:
+            stream.cancel(mode="after_turn")
         await self._maybe_snapshot()
 
     async def attach_stream(
@@ -216,7 +225,7 @@ class AgentCoordinator:
         stream: Any,
     ) -> None:
         async with self._lock:
-            self.runtimes.setdefault(agent_id, AgentRuntime()).stream = stream
+            self._runtime_locked(agent_id).stream = stream
 
     async def detach_stream(
         self,
@@ -224,7 +233,7 @@ class AgentCoordinator:
         stream: Any,
     ) -> None:
         async with self._lock:
-            runtime = self.runtimes.setdefault(agent_id, AgentRuntime())
+            runtime = self._runtime_locked(agent_id)
             if runtime.stream is stream:
                 runtime.stream = None
 
@@ -266,6 +275,25 @@ class AgentCoordinator:
             },
         )
 
+    def _runtime_locked(self, agent_id: str) -> AgentRuntime:
+        # setdefault(agent_id, AgentRuntime()) would build (and usually discard)
+        # a fresh runtime with its own asyncio.Event on every call.
+        runtime = self.runtimes.get(agent_id)
+        if runtime is None:
+            runtime = self.runtimes[agent_id] = AgentRuntime()
+        return runtime
+
+    def _mark_stopped_locked(self, agent_id: str) -> Any | None:
+        """Flip ``agent_id`` to stopped and wake it; return its live stream.
+
+        The caller cancels the returned stream (if any) once the lock is
+        released.
+        """
+        self.statuses[agent_id] = "stopped"
+        runtime = self._runtime_locked(agent_id)
+        runtime.wake.set()
+        return runtime.stream
+
     def _subtree_order_locked(self, agent_id: str) -> list[str]:
         queue = [agent_id]
         order: list[str] = []
@@ -293,7 +321,7 @@ class AgentCoordinator:
             self.metadata = {aid: dict(md) for aid, md in snap.get("metadata", {}).items()}
             self.pending_counts = dict(snap.get("pending_counts", {}))
             for aid in self.statuses:
-                self.runtimes.setdefault(aid, AgentRuntime())
+                self._runtime_locked(aid)
 
     async def _maybe_snapshot(self) -> None:
         path = self._snapshot_path
@@ -302,18 +330,22 @@ class AgentCoordinator:
         try:
             data = await self.snapshot()
             payload = json.dumps(data, ensure_ascii=False, default=str)
+            # Many transitions (re-marking a running agent, draining an empty
+            # inbox) leave the graph unchanged; don't rewrite identical bytes.
+            if payload == self._last_snapshot_payload:
+                return
             path.parent.mkdir(parents=True, exist_ok=True)
             with tempfile.NamedTemporaryFile(
-                mode="w",
-                encoding="utf-8",
+                mode="wb",
                 dir=str(path.parent),
                 prefix=f".{path.name}.",
                 suffix=".tmp",
                 delete=False,
             ) as tmp:
-                tmp.write(payload)
+                tmp.write(payload.encode("utf-8"))
                 tmp_path = Path(tmp.name)
             tmp_path.replace(path)
+            self._last_snapshot_payload = payload
         except Exception:
             logger.exception("coordinator snapshot to %s failed", path)
 
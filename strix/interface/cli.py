@@ -4,7 +4,6 @@ import logging
 import signal
 import sys
 import threading
-import time
 from typing import Any
 
 from rich.console import Console
@@ -154,16 +153,17 @@ async def run_cli(args: Any) -> None:  # noqa: PLR0915
     try:
         console.print()
 
+        # The panel only changes when the updater rebuilds it, so skip Live's
+        # own refresh thread and repaint once per rebuild instead.
         with Live(
-            create_live_status(), console=console, refresh_per_second=2, transient=False
+            create_live_status(), console=console, auto_refresh=False, transient=False
         ) as live:
             stop_updates = threading.Event()
 
             def update_status() -> None:
-                while not stop_updates.is_set():
+                while not stop_updates.wait(2):
                     try:
-                        live.update(create_live_status())
-                        time.sleep(2)
+                        live.update(create_live_status(), refresh=True)
                     except Exception:
                         break
 
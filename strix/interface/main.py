@@ -35,7 +35,7 @@ from strix.interface.utils import (
     build_final_stats_text,
     build_mount_targets_info,
     check_docker_connection,
-    clone_repository,
+    clone_repository_targets,
     collect_local_sources,
     dedupe_local_targets,
     find_oversized_local_targets,
@@ -222,7 +222,7 @@ async def warm_up_llm() -> None:
         configure_sdk_model_defaults(settings)
         llm = settings.llm
 
-        raw_model = (llm.model or "").strip()
+        raw_model = llm.model or ""
         if (
             raw_model
             and "/" not in raw_model
@@ -270,7 +270,7 @@ async def warm_up_llm() -> None:
             ),
             timeout=llm.timeout,
         )
-        logger.info("LLM warm-up succeeded for model %s", (llm.model or "").strip())
+        logger.info("LLM warm-up succeeded for model %s", raw_model)
 
     except Exception as e:
         logger.exception("LLM warm-up failed")
@@ -737,11 +737,28 @@ def pull_docker_image() -> None:
     console.print()
 
 
-def main() -> None:
-    configure_dependency_logging()
+def _install_event_loop_policy() -> None:
+    """Pick the event loop used by every ``asyncio.run`` / ``new_event_loop`` below.
 
+    Windows needs the selector loop. Elsewhere uvloop is used when it's
+    installed (``pip install strix-agent[speedups]``); it's optional, so a
+    missing import silently keeps the stdlib loop.
+    """
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop policy")
+
+
+def main() -> None:
+    configure_dependency_logging()
+
+    _install_event_loop_policy()
 
     args = parse_arguments()
 
@@ -759,12 +776,7 @@ def main() -> None:
     args.run_name = args.resume or generate_run_name(args.targets_info)
 
     if not args.resume:
-        for target_info in args.targets_info:
-            if target_info["type"] == "repository":
-                repo_url = target_info["details"]["target_repo"]
-                dest_name = target_info["details"].get("workspace_subdir")
-                cloned_path = clone_repository(repo_url, args.run_name, dest_name)
-                target_info["details"]["cloned_repo_path"] = cloned_path
+        clone_repository_targets(args.targets_info, args.run_name)
 
         args.local_sources = collect_local_sources(args.targets_info)
         try:
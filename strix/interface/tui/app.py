@@ -6,7 +6,9 @@ import logging
 import signal
 import sys
 import threading
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Sequence
+from functools import cache
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as pkg_version
 from pathlib import Path
@@ -16,6 +18,8 @@ from typing import TYPE_CHECKING, Any, ClassVar
 if TYPE_CHECKING:
     from textual.timer import Timer
 
+from pygments.lexers import PythonLexer
+from pygments.styles import get_style_by_name
 from rich.align import Align
 from rich.console import Group
 from rich.panel import Panel
@@ -45,6 +49,22 @@ from strix.runtime import session_manager
 
 logger = logging.getLogger(__name__)
 
+# Consulted per agent on every UI tick / spinner frame; built once.
+_ACTIVE_AGENT_STATUSES: frozenset[str] = frozenset({"running", "waiting"})
+_AGENT_STATUS_ICONS: dict[str, str] = {
+    "running": "⚪",
+    "waiting": "⏸",
+    "completed": "🟢",
+    "failed": "🔴",
+    "stopped": "■",
+}
+
+
+@cache
+def _get_style_colors() -> dict[Any, str]:
+    style = get_style_by_name("native")
+    return {token: f"#{style_def['color']}" for token, style_def in style if style_def["color"]}
+
 
 def get_package_version() -> str:
     try:
@@ -116,9 +136,11 @@ class SplashScreen(Static):  # type: ignore[misc]
         self._animation_timer: Timer | None = None
         self._panel_static: Static | None = None
         self._version = "dev"
+        self._static_rows: tuple[list[Align], list[Align]] | None = None
 
     def compose(self) -> ComposeResult:
         self._version = get_package_version()
+        self._static_rows = None
         self._animation_step = 0
         start_line = self._build_start_line_text(self._animation_step)
         panel = self._build_panel(start_line)
@@ -145,17 +167,26 @@ class SplashScreen(Static):  # type: ignore[misc]
         self._panel_static.update(panel)
 
     def _build_panel(self, start_line: Text) -> Panel:
-        content = Group(
-            Align.center(Text(self.BANNER.strip("\n"), style=self.PRIMARY_GREEN, justify="center")),
-            Align.center(Text(" ")),
-            Align.center(self._build_welcome_text()),
-            Align.center(self._build_version_text()),
-            Align.center(self._build_tagline_text()),
-            Align.center(Text(" ")),
-            Align.center(start_line.copy()),
-            Align.center(Text(" ")),
-            Align.center(self._build_url_text()),
-        )
+        # Only the shimmering start line changes between the 20 fps frames;
+        # build the banner/welcome/version/url rows once and reuse them.
+        if self._static_rows is None:
+            banner = Text(self.BANNER.strip("\n"), style=self.PRIMARY_GREEN, justify="center")
+            self._static_rows = (
+                [
+                    Align.center(banner),
+                    Align.center(Text(" ")),
+                    Align.center(self._build_welcome_text()),
+                    Align.center(self._build_version_text()),
+                    Align.center(self._build_tagline_text()),
+                    Align.center(Text(" ")),
+                ],
+                [
+                    Align.center(Text(" ")),
+                    Align.center(self._build_url_text()),
+                ],
+            )
+        header, footer = self._static_rows
+        content = Group(*header, Align.center(start_line), *footer)
 
         return Panel.fit(content, border_style=self.PRIMARY_GREEN, padding=(1, 6))
 
@@ -306,14 +337,8 @@ class VulnerabilityDetailScreen(ModalScreen):  # type: ignore[misc]
 
     def _highlight_python(self, code: str) -> Text:
         try:
-            from pygments.lexers import PythonLexer
-            from pygments.styles import get_style_by_name
-
             lexer = PythonLexer()
-            style = get_style_by_name("native")
-            colors = {
-                token: f"#{style_def['color']}" for token, style_def in style if style_def["color"]
-            }
+            colors = _get_style_colors()
 
             text = Text()
             for token_type, token_value in lexer.get_tokens(code):
@@ -327,7 +352,7 @@ class VulnerabilityDetailScreen(ModalScreen):  # type: ignore[misc]
                         break
                     tt = tt.parent
                 text.append(token_value, style=color)
-        except (ImportError, KeyError, AttributeError):
+        except (KeyError, AttributeError):
             return Text(code)
         else:
             return text
@@ -700,6 +725,9 @@ class StrixTUIApp(App):  # type: ignore[misc]
         self.live_view = TuiLiveView()
         self.live_view.hydrate_from_run_dir(self.report_state.get_run_dir())
         self._agent_graph_sync_future: Any | None = None
+        # SDK stream events land here from the scan thread and are folded
+        # into live_view in one batch per UI tick (see _drain_sdk_events).
+        self._pending_sdk_events: deque[tuple[str, Any]] = deque()
 
         from strix.core.agents import AgentCoordinator
 
@@ -875,6 +903,8 @@ class StrixTUIApp(App):  # type: ignore[misc]
         self.set_interval(0.35, self._update_ui)
 
     def _update_ui(self) -> None:
+        self._drain_sdk_events()
+
         if self.show_splash:
             return
 
@@ -926,40 +956,44 @@ class StrixTUIApp(App):  # type: ignore[misc]
                 except Exception:
                     logger.exception("TUI agent graph sync failed")
                 else:
+                    agents = self.live_view.agents
                     for agent_id, status in statuses.items():
+                        name = names.get(agent_id, agent_id)
+                        parent_id = parent_of.get(agent_id)
+                        current = agents.get(agent_id)
+                        if (
+                            current is not None
+                            and current.get("status") == status
+                            and current.get("name") == name
+                            and current.get("parent_id") == parent_id
+                        ):
+                            continue
                         self.live_view.upsert_agent(
                             agent_id,
-                            name=names.get(agent_id, agent_id),
-                            parent_id=parent_of.get(agent_id),
+                            name=name,
+                            parent_id=parent_id,
                             status=status,
                         )
 
         if self._scan_loop is None or self._scan_loop.is_closed():
             return
 
-        async def collect() -> tuple[dict[str, str | None], dict[str, Any], dict[str, str]]:
-            return await self.coordinator.graph_snapshot()
-
-        self._agent_graph_sync_future = asyncio.run_coroutine_threadsafe(collect(), self._scan_loop)
+        # One cross-thread hop per tick fetches parents, statuses and names
+        # together; graph_snapshot is already a coroutine, so submit it as-is.
+        self._agent_graph_sync_future = asyncio.run_coroutine_threadsafe(
+            self.coordinator.graph_snapshot(), self._scan_loop
+        )
 
     def _update_agent_node(self, agent_id: str, agent_data: dict[str, Any]) -> bool:
-        if agent_id not in self.agent_nodes:
+        agent_node = self.agent_nodes.get(agent_id)
+        if agent_node is None:
             return False
 
         try:
-            agent_node = self.agent_nodes[agent_id]
             agent_name_raw = agent_data.get("name", "Agent")
             status = agent_data.get("status", "running")
 
-            status_indicators = {
-                "running": "⚪",
-                "waiting": "⏸",
-                "completed": "🟢",
-                "failed": "🔴",
-                "stopped": "■",
-            }
-
-            status_icon = status_indicators.get(status, "○")
+            status_icon = _AGENT_STATUS_ICONS.get(status, "○")
             vuln_count = self._agent_vulnerability_count(agent_id)
             vuln_indicator = f" ({vuln_count})" if vuln_count > 0 else ""
             agent_name = f"{status_icon} {agent_name_raw}{vuln_indicator}"
@@ -969,7 +1003,7 @@ class StrixTUIApp(App):  # type: ignore[misc]
                 return True
 
         except (KeyError, AttributeError, ValueError) as e:
-            logger.warning(f"Failed to update agent node label: {e}")
+            logger.warning("Failed to update agent node label: %s", e)
 
         return False
 
@@ -1080,7 +1114,7 @@ class StrixTUIApp(App):  # type: ignore[misc]
             else:
                 combined.append(str(item))
 
-    def _get_rendered_events_content(self, events: list[dict[str, Any]]) -> Any:
+    def _get_rendered_events_content(self, events: Sequence[dict[str, Any]]) -> Any:
         renderables: list[Any] = []
 
         if not events:
@@ -1302,10 +1336,12 @@ class StrixTUIApp(App):  # type: ignore[misc]
     def _animate_dots(self) -> None:
         has_active_agents = False
 
-        if self.selected_agent_id and self.selected_agent_id in self.live_view.agents:
-            agent_data = self.live_view.agents[self.selected_agent_id]
+        agent_data = (
+            self.live_view.agents.get(self.selected_agent_id) if self.selected_agent_id else None
+        )
+        if agent_data is not None:
             status = agent_data.get("status", "running")
-            if status in ["running", "waiting"]:
+            if status in _ACTIVE_AGENT_STATUSES:
                 has_active_agents = True
                 num_colors = len(self._sweep_colors)
                 offset = num_colors - 1
@@ -1317,7 +1353,7 @@ class StrixTUIApp(App):  # type: ignore[misc]
 
         if not has_active_agents:
             has_active_agents = any(
-                agent_data.get("status", "running") in ["running", "waiting"]
+                agent_data.get("status", "running") in _ACTIVE_AGENT_STATUSES
                 for agent_data in self.live_view.agents.values()
             )
 
@@ -1329,16 +1365,10 @@ class StrixTUIApp(App):  # type: ignore[misc]
         return self.live_view.has_events_for_agent(agent_id)
 
     def _agent_vulnerability_count(self, agent_id: str) -> int:
-        return sum(
-            1
-            for vuln in self.report_state.vulnerability_reports
-            if vuln.get("agent_id") == agent_id
-        )
+        return self.report_state.get_agent_vulnerability_count(agent_id)
 
-    def _gather_agent_events(self, agent_id: str) -> list[dict[str, Any]]:
-        events = self.live_view.events_for_agent(agent_id)
-        events.sort(key=lambda e: (e["timestamp"], e["id"]))
-        return events
+    def _gather_agent_events(self, agent_id: str) -> Sequence[dict[str, Any]]:
+        return self.live_view.events_for_agent(agent_id)
 
     def watch_selected_agent_id(self, _agent_id: str | None) -> None:
         if len(self.screen_stack) > 1 or self.show_splash:
@@ -1407,13 +1437,19 @@ class StrixTUIApp(App):  # type: ignore[misc]
         self._scan_thread.start()
 
     def _capture_sdk_event(self, agent_id: str, event: Any) -> None:
-        try:
-            self.call_from_thread(self._record_sdk_event, agent_id, event)
-        except RuntimeError:
-            self._record_sdk_event(agent_id, event)
-
-    def _record_sdk_event(self, agent_id: str, event: Any) -> None:
-        self.live_view.ingest_sdk_event(agent_id, event)
+        # Runs on the scan loop for every streamed token/tool event. A
+        # call_from_thread round-trip here would block the whole scan until
+        # the UI caught up, so just enqueue; deque.append is thread-safe.
+        # Most raw deltas (reasoning, tool-argument chunks) are never rendered,
+        # so drop them here instead of queueing them for the UI thread.
+        if self.live_view.accepts_sdk_event(event):
+            self._pending_sdk_events.append((agent_id, event))
+
+    def _drain_sdk_events(self) -> None:
+        pending = self._pending_sdk_events
+        while pending:
+            agent_id, event = pending.popleft()
+            self.live_view.ingest_sdk_event(agent_id, event)
 
     def _add_agent_node(self, agent_data: dict[str, Any]) -> None:
         if len(self.screen_stack) > 1 or self.show_splash:
@@ -1433,22 +1469,14 @@ class StrixTUIApp(App):  # type: ignore[misc]
 
         agent_name_raw = agent_data.get("name", "Agent")
 
-        status_indicators = {
-            "running": "⚪",
-            "waiting": "⏸",
-            "completed": "🟢",
-            "failed": "🔴",
-            "stopped": "■",
-        }
-
-        status_icon = status_indicators.get(status, "○")
+        status_icon = _AGENT_STATUS_ICONS.get(status, "○")
         vuln_count = self._agent_vulnerability_count(agent_id)
         vuln_indicator = f" ({vuln_count})" if vuln_count > 0 else ""
         agent_name = f"{status_icon} {agent_name_raw}{vuln_indicator}"
 
         try:
-            if parent_id and parent_id in self.agent_nodes:
-                parent_node = self.agent_nodes[parent_id]
+            parent_node = self.agent_nodes.get(parent_id) if parent_id else None
+            if parent_node is not None:
                 agent_node = parent_node.add(
                     agent_name,
                     data={"agent_id": agent_id},
@@ -1470,7 +1498,7 @@ class StrixTUIApp(App):  # type: ignore[misc]
 
             self._reorganize_orphaned_agents(agent_id)
         except (AttributeError, ValueError, RuntimeError) as e:
-            logger.warning(f"Failed to add agent node {agent_id}: {e}")
+            logger.warning("Failed to add agent node %s: %s", agent_id, e)
 
     def _copy_node_under(self, node_to_copy: TreeNode, new_parent: TreeNode) -> None:
         agent_id = node_to_copy.data["agent_id"]
@@ -1478,15 +1506,7 @@ class StrixTUIApp(App):  # type: ignore[misc]
         agent_name_raw = agent_data.get("name", "Agent")
         status = agent_data.get("status", "running")
 
-        status_indicators = {
-            "running": "⚪",
-            "waiting": "⏸",
-            "completed": "🟢",
-            "failed": "🔴",
-            "stopped": "■",
-        }
-
-        status_icon = status_indicators.get(status, "○")
+        status_icon = _AGENT_STATUS_ICONS.get(status, "○")
         vuln_count = self._agent_vulnerability_count(agent_id)
         vuln_indicator = f" ({vuln_count})" if vuln_count > 0 else ""
         agent_name = f"{status_icon} {agent_name_raw}{vuln_indicator}"
@@ -1522,9 +1542,8 @@ class StrixTUIApp(App):  # type: ignore[misc]
         parent_node = self.agent_nodes[new_parent_id]
 
         for child_agent_id in agents_to_move:
-            if child_agent_id in self.agent_nodes:
-                old_node = self.agent_nodes[child_agent_id]
-
+            old_node = self.agent_nodes.get(child_agent_id)
+            if old_node is not None:
                 if old_node.parent is parent_node:
                     continue
 
@@ -1614,12 +1633,13 @@ class StrixTUIApp(App):  # type: ignore[misc]
 
     def _get_agent_name(self, agent_id: str) -> str:
         try:
-            if agent_id in self.live_view.agents:
-                agent_name = self.live_view.agents[agent_id].get("name")
+            agent_data = self.live_view.agents.get(agent_id)
+            if agent_data is not None:
+                agent_name = agent_data.get("name")
                 if isinstance(agent_name, str):
                     return agent_name
         except (KeyError, AttributeError) as e:
-            logger.warning(f"Could not retrieve agent name for {agent_id}: {e}")
+            logger.warning("Could not retrieve agent name for %s: %s", agent_id, e)
         return "Unknown Agent"
 
     def action_toggle_help(self) -> None:
@@ -1682,22 +1702,21 @@ class StrixTUIApp(App):  # type: ignore[misc]
         agent_name = "Unknown Agent"
 
         try:
-            if self.selected_agent_id in self.live_view.agents:
-                agent_data = self.live_view.agents[self.selected_agent_id]
+            agent_data = self.live_view.agents.get(self.selected_agent_id or "")
+            if agent_data is not None:
                 agent_name = agent_data.get("name", "Unknown Agent")
 
                 agent_status = agent_data.get("status", "running")
-                if agent_status not in ["running", "waiting"]:
+                if agent_status not in _ACTIVE_AGENT_STATUSES:
                     return agent_name, False
 
-                agent_events = self._gather_agent_events(self.selected_agent_id)
-                if not agent_events:
+                if not self.live_view.has_events_for_agent(self.selected_agent_id or ""):
                     return agent_name, False
 
                 return agent_name, True
 
         except (KeyError, AttributeError, ValueError) as e:
-            logger.warning(f"Failed to gather agent events: {e}")
+            logger.warning("Failed to gather agent events: %s", e)
 
         return agent_name, False
 
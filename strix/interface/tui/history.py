@@ -23,20 +23,22 @@ def load_session_history(run_dir: Path, agent_ids: Any) -> list[tuple[str, dict[
     session_ids = [aid for aid in agent_ids if isinstance(aid, str)]
     if not agents_db.exists() or not session_ids:
         return []
-    session_id_set = set(session_ids)
+    # Let SQLite select the agents we render instead of decoding every stored
+    # message in Python and discarding the ones for unknown sessions.
+    placeholders = ",".join("?" * len(session_ids))
+    query = (
+        "select id, session_id, message_data, created_at from agent_messages "  # noqa: S608
+        f"where session_id in ({placeholders}) order by id"
+    )
     try:
         with sqlite3.connect(agents_db) as conn:
-            rows = conn.execute(
-                "select id, session_id, message_data, created_at from agent_messages order by id"
-            ).fetchall()
+            rows = conn.execute(query, session_ids).fetchall()
     except sqlite3.Error:
         logger.exception("Failed to hydrate TUI history from %s", agents_db)
         return []
 
     items: list[tuple[str, dict[str, Any], str]] = []
     for row_id, agent_id, message_data, created_at in rows:
-        if agent_id not in session_id_set:
-            continue
         try:
             item = json.loads(message_data)
         except (TypeError, json.JSONDecodeError):
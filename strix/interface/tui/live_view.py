@@ -2,22 +2,35 @@
 
 from __future__ import annotations
 
+import bisect
 import json
+import operator
+import re
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
 
 from strix.core.paths import runtime_state_dir
 from strix.interface.tui.history import load_session_history
 
 
+# Chat order for one agent's events: by (possibly bumped) timestamp, then id.
+_EVENT_ORDER = operator.itemgetter("timestamp", "id")
+_JSON_START = re.compile(r'\s*[\[{"\-0-9tfnNI]')
+
+
 class TuiLiveView:
     def __init__(self) -> None:
         self.agents: dict[str, dict[str, Any]] = {}
         self.events: list[dict[str, Any]] = []
+        # Per-agent view of ``events``, kept in chat order (see _EVENT_ORDER)
+        # so the chat pane can render one agent's stream on every refresh
+        # tick without rescanning or re-sorting the whole run.
+        self._events_by_agent: dict[str, list[dict[str, Any]]] = {}
         self._next_event_id = 1
         self._open_assistant_event_by_agent: dict[str, dict[str, Any]] = {}
         self._tool_event_by_call_id: dict[str, dict[str, Any]] = {}
@@ -97,6 +110,15 @@ class TuiLiveView:
             },
         )
 
+    @staticmethod
+    def accepts_sdk_event(event: Any) -> bool:
+        """Whether ``ingest_sdk_event`` would do anything with ``event``."""
+        event_type = getattr(event, "type", "")
+        if event_type == "raw_response_event":
+            data_type = getattr(getattr(event, "data", None), "type", "")
+            return data_type == "response.output_text.delta"
+        return event_type == "run_item_stream_event"
+
     def ingest_sdk_event(self, agent_id: str, event: Any) -> None:
         event_type = getattr(event, "type", "")
         if event_type == "raw_response_event":
@@ -114,11 +136,12 @@ class TuiLiveView:
         elif item_type == "tool_call_output_item":
             self._record_tool_output(agent_id, item)
 
-    def events_for_agent(self, agent_id: str) -> list[dict[str, Any]]:
-        return [event for event in self.events if event.get("agent_id") == agent_id]
+    def events_for_agent(self, agent_id: str) -> Sequence[dict[str, Any]]:
+        """Read-only view of one agent's events in chat order; copy before mutating."""
+        return self._events_by_agent.get(agent_id, ())
 
     def has_events_for_agent(self, agent_id: str) -> bool:
-        return any(event.get("agent_id") == agent_id for event in self.events)
+        return bool(self._events_by_agent.get(agent_id))
 
     def _ingest_raw_response_event(self, agent_id: str, data: Any) -> None:
         data_type = getattr(data, "type", "")
@@ -277,12 +300,20 @@ class TuiLiveView:
         }
         self._next_event_id += 1
         self.events.append(event)
+        bisect.insort(self._events_by_agent.setdefault(agent_id, []), event, key=_EVENT_ORDER)
         return event
 
-    @staticmethod
-    def _bump_event(event: dict[str, Any], *, timestamp: str | None = None) -> None:
+    def _bump_event(self, event: dict[str, Any], *, timestamp: str | None = None) -> None:
         event["version"] = int(event.get("version", 0)) + 1
         event["timestamp"] = timestamp or datetime.now(UTC).isoformat()
+        # A bump moves the event to its new timestamp. The bumped event is
+        # almost always the newest one, so the search from the end is short.
+        agent_events = self._events_by_agent[event["agent_id"]]
+        for index in range(len(agent_events) - 1, -1, -1):
+            if agent_events[index] is event:
+                del agent_events[index]
+                break
+        bisect.insort(agent_events, event, key=_EVENT_ORDER)
 
 
 def _sdk_tool_call_data(item: Any) -> dict[str, Any]:
@@ -342,7 +373,9 @@ def _parse_json_object(value: Any) -> dict[str, Any]:
 
 
 def _parse_json_value(value: Any) -> Any:
-    if not isinstance(value, str):
+    # Most tool outputs are plain text (shell output, page bodies); skip the
+    # decoder and its exception when the first non-blank char can't start JSON.
+    if not isinstance(value, str) or not _JSON_START.match(value):
         return value
     try:
         return json.loads(value)
@@ -4,6 +4,15 @@ from typing import Any, ClassVar
 from textual.widgets import Static
 
 
+_STATUS_ICONS: dict[str, tuple[str, str]] = {
+    "running": ("● In progress...", "#f59e0b"),
+    "completed": ("✓ Done", "#22c55e"),
+    "failed": ("✗ Failed", "#dc2626"),
+    "error": ("✗ Error", "#dc2626"),
+}
+_UNKNOWN_STATUS_ICON = ("○ Unknown", "dim")
+
+
 class BaseToolRenderer(ABC):
     tool_name: ClassVar[str] = ""
     css_classes: ClassVar[list[str]] = ["tool-call"]
@@ -15,13 +24,7 @@ class BaseToolRenderer(ABC):
 
     @classmethod
     def status_icon(cls, status: str) -> tuple[str, str]:
-        icons = {
-            "running": ("● In progress...", "#f59e0b"),
-            "completed": ("✓ Done", "#22c55e"),
-            "failed": ("✗ Failed", "#dc2626"),
-            "error": ("✗ Error", "#dc2626"),
-        }
-        return icons.get(status, ("○ Unknown", "dim"))
+        return _STATUS_ICONS.get(status, _UNKNOWN_STATUS_ICON)
 
     @classmethod
     def get_css_classes(cls, status: str) -> str:
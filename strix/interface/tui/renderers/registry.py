@@ -6,6 +6,9 @@ from textual.widgets import Static
 from .base_renderer import BaseToolRenderer
 
 
+_FINISHED_STATUSES = frozenset({"completed", "failed", "error"})
+
+
 class ToolTUIRegistry:
     _renderers: ClassVar[dict[str, type[BaseToolRenderer]]] = {}
 
@@ -59,7 +62,7 @@ def _render_default_tool_widget(tool_data: dict[str, Any]) -> Static:
         text.append(str_v)
         text.append("\n")
 
-    if status in ["completed", "failed", "error"] and result is not None:
+    if status in _FINISHED_STATUSES and result is not None:
         result_str = str(result)
         text.append("Result: ", style="bold")
         text.append(result_str)
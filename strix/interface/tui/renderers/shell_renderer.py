@@ -21,6 +21,7 @@ STRIP_PATTERNS = [
     r"^Process running with session ID \d+\s*$",
     r"^Original token count: \d+\s*$",
 ]
+_STRIP_RE = re.compile("|".join(f"(?:{pattern})" for pattern in STRIP_PATTERNS), re.MULTILINE)
 
 _EXIT_RE = re.compile(r"Process exited with code (-?\d+)")
 _SESSION_RE = re.compile(r"Process running with session ID (\d+)")
@@ -72,8 +73,7 @@ def _truncate_line(line: str) -> str:
 
 def _clean_output(output: str) -> str:
     cleaned = Text.from_ansi(output).plain.translate(_CONTROL_BYTES_TO_DROP)
-    for pattern in STRIP_PATTERNS:
-        cleaned = re.sub(pattern, "", cleaned, flags=re.MULTILINE)
+    cleaned = _STRIP_RE.sub("", cleaned)
 
     if cleaned.strip():
         lines = cleaned.splitlines()
@@ -1,3 +1,4 @@
+import functools
 import ipaddress
 import json
 import logging
@@ -8,9 +9,10 @@ import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, NoReturn
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse
 from urllib.request import Request, urlopen
@@ -27,15 +29,19 @@ from strix.config import load_settings
 logger = logging.getLogger(__name__)
 
 
+_SEVERITY_COLORS: dict[str, str] = {
+    "critical": "#dc2626",
+    "high": "#ea580c",
+    "medium": "#d97706",
+    "low": "#65a30d",
+    "info": "#0284c7",
+}
+_DEFAULT_SEVERITY_COLOR = "#6b7280"
+_SEVERITY_LEVELS = ("critical", "high", "medium", "low", "info")
+
+
 def get_severity_color(severity: str) -> str:
-    severity_colors = {
-        "critical": "#dc2626",
-        "high": "#ea580c",
-        "medium": "#d97706",
-        "low": "#65a30d",
-        "info": "#0284c7",
-    }
-    return severity_colors.get(severity, "#6b7280")
+    return _SEVERITY_COLORS.get(severity, _DEFAULT_SEVERITY_COLOR)
 
 
 def get_cvss_color(cvss_score: float) -> str:
@@ -211,17 +217,13 @@ def _build_vulnerability_stats(stats_text: Text, report_state: Any) -> None:
     vuln_count = len(report_state.vulnerability_reports)
 
     if vuln_count > 0:
-        severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0, "info": 0}
-        for report in report_state.vulnerability_reports:
-            severity = report.get("severity", "").lower()
-            if severity in severity_counts:
-                severity_counts[severity] += 1
+        severity_counts = _severity_counts(report_state)
 
         stats_text.append("Vulnerabilities  ", style="bold red")
 
         severity_parts = []
-        for severity in ["critical", "high", "medium", "low", "info"]:
-            count = severity_counts[severity]
+        for severity in _SEVERITY_LEVELS:
+            count = severity_counts.get(severity, 0)
             if count > 0:
                 severity_color = get_severity_color(severity)
                 severity_text = Text()
@@ -245,6 +247,18 @@ def _build_vulnerability_stats(stats_text: Text, report_state: Any) -> None:
         stats_text.append("\n")
 
 
+def _severity_counts(report_state: Any) -> dict[str, int]:
+    if hasattr(report_state, "get_severity_counts"):
+        counts = report_state.get_severity_counts()
+        return counts if isinstance(counts, dict) else {}
+    counts = dict.fromkeys(_SEVERITY_LEVELS, 0)
+    for report in report_state.vulnerability_reports:
+        severity = report.get("severity", "").lower()
+        if severity in counts:
+            counts[severity] += 1
+    return counts
+
+
 def _llm_usage(report_state: Any) -> dict[str, Any]:
     if hasattr(report_state, "get_total_llm_usage"):
         usage = report_state.get_total_llm_usage()
@@ -344,15 +358,11 @@ def build_live_stats_text(report_state: Any) -> Text:
     stats_text.append(f"{vuln_count}", style="white")
     stats_text.append("\n")
     if vuln_count > 0:
-        severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0, "info": 0}
-        for report in report_state.vulnerability_reports:
-            severity = report.get("severity", "").lower()
-            if severity in severity_counts:
-                severity_counts[severity] += 1
+        severity_counts = _severity_counts(report_state)
 
         severity_parts = []
-        for severity in ["critical", "high", "medium", "low", "info"]:
-            count = severity_counts[severity]
+        for severity in _SEVERITY_LEVELS:
+            count = severity_counts.get(severity, 0)
             if count > 0:
                 severity_color = get_severity_color(severity)
                 severity_text = Text()
@@ -1051,6 +1061,9 @@ def resolve_diff_scope_context(
     )
 
 
+# Each probe is a network round-trip with a 10s timeout; the same URL passed
+# more than once (repeated -t flags, re-validation) should only pay it once.
+@functools.lru_cache(maxsize=128)
 def _is_http_git_repo(url: str) -> bool:
     check_url = f"{url.rstrip('/')}/info/refs?service=git-upload-pack"
     try:
@@ -1330,10 +1343,15 @@ def dedupe_local_targets(targets_info: list[dict[str, Any]]) -> list[dict[str, A
     return result
 
 
+# Literal spellings are answered by a set lookup; only other addresses fall
+# through to ipaddress parsing for the rest of 127.0.0.0/8.
+_LOCALHOST_LITERALS = frozenset({"localhost", "127.0.0.1", "0.0.0.0", "::1"})  # nosec B104
+
+
 def _is_localhost_host(host: str) -> bool:
     host_lower = host.lower().strip("[]")
 
-    if host_lower in ("localhost", "0.0.0.0", "::1"):  # nosec B104
+    if host_lower in _LOCALHOST_LITERALS:
         return True
 
     try:
@@ -1371,13 +1389,88 @@ def rewrite_localhost_targets(targets_info: list[dict[str, Any]], host_gateway:
                 details["target_ip"] = host_gateway
 
 
+_MAX_PARALLEL_CLONES = 4
+
+
+def clone_repository_targets(targets_info: list[dict[str, Any]], run_name: str) -> None:
+    """Clone every repository target, recording ``cloned_repo_path`` on each.
+
+    Clones are network/subprocess bound, so several repositories are fetched
+    in parallel under one shared spinner rather than one after another.
+    """
+    repo_targets = [t for t in targets_info if t["type"] == "repository"]
+    if not repo_targets:
+        return
+    if len(repo_targets) == 1:
+        details = repo_targets[0]["details"]
+        details["cloned_repo_path"] = clone_repository(
+            details["target_repo"], run_name, details.get("workspace_subdir")
+        )
+        return
+
+    git_executable = _require_git()
+    # Concurrent clones can't share the TTY for credential prompts, so the
+    # parallel pass runs with prompts disabled. Anything it couldn't fetch
+    # (private repos without a credential helper, or a real failure) is
+    # retried one at a time through clone_repository below, which can prompt
+    # and reports a failure the same way a single-repo scan does.
+    env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+    retry: list[dict[str, Any]] = []
+    console = Console()
+    with (
+        console.status(f"[bold cyan]Cloning {len(repo_targets)} repositories...", spinner="dots"),
+        ThreadPoolExecutor(max_workers=min(len(repo_targets), _MAX_PARALLEL_CLONES)) as pool,
+    ):
+        futures = {
+            pool.submit(
+                _run_git_clone,
+                git_executable,
+                t["details"]["target_repo"],
+                run_name,
+                t["details"].get("workspace_subdir"),
+                env=env,
+            ): t
+            for t in repo_targets
+        }
+        for future in as_completed(futures):
+            details = futures[future]["details"]
+            try:
+                details["cloned_repo_path"] = future.result()
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                retry.append(details)
+
+    for details in retry:
+        details["cloned_repo_path"] = clone_repository(
+            details["target_repo"], run_name, details.get("workspace_subdir")
+        )
+
+
 def clone_repository(repo_url: str, run_name: str, dest_name: str | None = None) -> str:
+    git_executable = _require_git()
     console = Console()
+    try:
+        with console.status(f"[bold cyan]Cloning repository {repo_url}...", spinner="dots"):
+            return _run_git_clone(git_executable, repo_url, run_name, dest_name)
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        _exit_on_clone_failure(repo_url, e)
+
 
+def _require_git() -> str:
     git_executable = shutil.which("git")
     if git_executable is None:
         raise FileNotFoundError("Git executable not found in PATH")
+    return git_executable
 
+
+def _run_git_clone(
+    git_executable: str,
+    repo_url: str,
+    run_name: str,
+    dest_name: str | None = None,
+    *,
+    env: dict[str, str] | None = None,
+) -> str:
     temp_dir = Path(tempfile.gettempdir()) / "strix_repos" / run_name
     temp_dir.mkdir(parents=True, exist_ok=True)
 
@@ -1391,60 +1484,47 @@ def clone_repository(repo_url: str, run_name: str, dest_name: str | None = None)
     if clone_path.exists():
         shutil.rmtree(clone_path)
 
-    try:
-        with console.status(f"[bold cyan]Cloning repository {repo_url}...", spinner="dots"):
-            subprocess.run(  # noqa: S603
-                [
-                    git_executable,
-                    "clone",
-                    repo_url,
-                    str(clone_path),
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+    subprocess.run(  # noqa: S603
+        [
+            git_executable,
+            "clone",
+            repo_url,
+            str(clone_path),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
 
-        return str(clone_path.absolute())
+    return str(clone_path.absolute())
 
-    except subprocess.CalledProcessError as e:
-        error_text = Text()
+
+def _exit_on_clone_failure(repo_url: str, error: Exception) -> NoReturn:
+    console = Console()
+    error_text = Text()
+    if isinstance(error, subprocess.CalledProcessError):
         error_text.append("REPOSITORY CLONE FAILED", style="bold red")
         error_text.append("\n\n", style="white")
         error_text.append(f"Could not clone repository: {repo_url}\n", style="white")
-        error_text.append(
-            f"Error: {e.stderr if hasattr(e, 'stderr') and e.stderr else str(e)}", style="dim red"
-        )
-
-        panel = Panel(
-            error_text,
-            title="[bold white]STRIX",
-            title_align="left",
-            border_style="red",
-            padding=(1, 2),
-        )
-        console.print("\n")
-        console.print(panel)
-        console.print()
-        sys.exit(1)
-    except FileNotFoundError:
-        error_text = Text()
+        error_text.append(f"Error: {error.stderr or error}", style="dim red")
+    else:
         error_text.append("GIT NOT FOUND", style="bold red")
         error_text.append("\n\n", style="white")
         error_text.append("Git is not installed or not available in PATH.\n", style="white")
         error_text.append("Please install Git to clone repositories.\n", style="white")
 
-        panel = Panel(
-            error_text,
-            title="[bold white]STRIX",
-            title_align="left",
-            border_style="red",
-            padding=(1, 2),
-        )
-        console.print("\n")
-        console.print(panel)
-        console.print()
-        sys.exit(1)
+    panel = Panel(
+        error_text,
+        title="[bold white]STRIX",
+        title_align="left",
+        border_style="red",
+        padding=(1, 2),
+    )
+    console.print("\n")
+    console.print(panel)
+    console.print()
+    sys.exit(1)
 
 
 def check_docker_connection() -> Any:
@@ -90,26 +90,31 @@ Rules:
 - Output ONLY the JSON object — no surrounding prose, no code fences."""
 
 
-def _prepare_report_for_comparison(report: dict[str, Any]) -> dict[str, Any]:
-    relevant_fields = [
-        "id",
-        "title",
-        "description",
-        "impact",
-        "target",
-        "technical_analysis",
-        "poc_description",
-        "endpoint",
-        "method",
-    ]
+_COMPARISON_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "impact",
+    "target",
+    "technical_analysis",
+    "poc_description",
+    "endpoint",
+    "method",
+)
+_MAX_COMPARISON_FIELD_CHARS = 8000
+
 
+def _prepare_report_for_comparison(report: dict[str, Any]) -> dict[str, Any]:
+    # Runs for every existing report on every new finding: one lookup per
+    # field, and only over-long strings are copied (truncated).
     cleaned = {}
-    for field in relevant_fields:
-        if report.get(field):
-            value = report[field]
-            if isinstance(value, str) and len(value) > 8000:
-                value = value[:8000] + "...[truncated]"
-            cleaned[field] = value
+    for field in _COMPARISON_FIELDS:
+        value = report.get(field)
+        if not value:
+            continue
+        if isinstance(value, str) and len(value) > _MAX_COMPARISON_FIELD_CHARS:
+            value = value[:_MAX_COMPARISON_FIELD_CHARS] + "...[truncated]"
+        cleaned[field] = value
 
     return cleaned
 
@@ -1,5 +1,7 @@
 import json
 import logging
+import threading
+from collections import Counter
 from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
@@ -66,6 +68,14 @@ class ReportState:
         }
         self._run_dir: Path | None = None
         self._saved_vuln_ids: set[str] = set()
+        # Running tallies so the live CLI/TUI stats don't rescan every report
+        # on each refresh; kept in step with ``vulnerability_reports``.
+        self._severity_counts: Counter[str] = Counter()
+        self._agent_vuln_counts: Counter[str] = Counter()
+        # Reports are filed from worker threads (see the reporting tool) while
+        # usage recording and cleanup saves happen on the scan loop; every
+        # mutation of the usage ledger or run_record holds this lock.
+        self._lock = threading.RLock()
 
         self.caido_url: str | None = None
         self.vulnerability_found_callback: Callable[[dict[str, Any]], None] | None = None
@@ -127,10 +137,13 @@ class ReportState:
                     f"vulnerabilities.json at {json_path} is not a list",
                 )
             self.vulnerability_reports = [r for r in data if isinstance(r, dict)]
+            self._severity_counts.clear()
+            self._agent_vuln_counts.clear()
             for r in self.vulnerability_reports:
                 rid = r.get("id")
                 if isinstance(rid, str):
                     self._saved_vuln_ids.add(rid)
+                self._count_report(r)
             logger.info(
                 "report state hydrated %d vulnerability report(s)",
                 len(self.vulnerability_reports),
@@ -157,10 +170,7 @@ class ReportState:
         agent_id: str | None = None,
         agent_name: str | None = None,
     ) -> str:
-        report_id = f"vuln-{len(self.vulnerability_reports) + 1:04d}"
-
         report: dict[str, Any] = {
-            "id": report_id,
             "title": title.strip(),
             "severity": severity.lower().strip(),
             "timestamp": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC"),
@@ -199,8 +209,12 @@ class ReportState:
         if agent_name:
             report["agent_name"] = agent_name
 
-        self.vulnerability_reports.append(report)
-        logger.info(f"Added vulnerability report: {report_id} - {title}")
+        with self._lock:
+            report_id = f"vuln-{len(self.vulnerability_reports) + 1:04d}"
+            report = {"id": report_id, **report}
+            self.vulnerability_reports.append(report)
+            self._count_report(report)
+        logger.info("Added vulnerability report: %s - %s", report_id, title)
         posthog.finding(severity)
         scarf.finding(severity)
 
@@ -213,6 +227,18 @@ class ReportState:
     def get_existing_vulnerabilities(self) -> list[dict[str, Any]]:
         return list(self.vulnerability_reports)
 
+    def get_severity_counts(self) -> dict[str, int]:
+        return dict(self._severity_counts)
+
+    def get_agent_vulnerability_count(self, agent_id: str) -> int:
+        return self._agent_vuln_counts.get(agent_id, 0)
+
+    def _count_report(self, report: dict[str, Any]) -> None:
+        self._severity_counts[str(report.get("severity", "")).lower()] += 1
+        agent_id = report.get("agent_id")
+        if isinstance(agent_id, str):
+            self._agent_vuln_counts[agent_id] += 1
+
     def record_sdk_usage(
         self,
         *,
@@ -222,19 +248,23 @@ class ReportState:
         model: str | None = None,
     ) -> None:
         """Record SDK-native token usage for one completed model run/cycle."""
-        if self._llm_usage.record(
-            agent_id=agent_id,
-            agent_name=agent_name,
-            model=model,
-            usage=usage,
-        ):
+        with self._lock:
+            recorded = self._llm_usage.record(
+                agent_id=agent_id,
+                agent_name=agent_name,
+                model=model,
+                usage=usage,
+            )
+        if recorded:
             self.save_run_data()
 
     def record_observed_llm_cost(self, cost: float) -> None:
-        self._llm_usage.record_observed_cost(cost)
+        with self._lock:
+            self._llm_usage.record_observed_cost(cost)
 
     def get_total_llm_usage(self) -> dict[str, Any]:
-        return dict(self.run_record.get("llm_usage") or self._build_llm_usage_record())
+        with self._lock:
+            return dict(self.run_record.get("llm_usage") or self._build_llm_usage_record())
 
     def get_total_llm_cost(self) -> float:
         """Live accumulated LLM cost, independent of the persisted run-record snapshot."""
@@ -247,7 +277,7 @@ class ReportState:
         technical_analysis: str,
         recommendations: str,
     ) -> None:
-        self.scan_results = {
+        scan_results = {
             "scan_completed": True,
             "executive_summary": executive_summary.strip(),
             "methodology": methodology.strip(),
@@ -255,9 +285,12 @@ class ReportState:
             "recommendations": recommendations.strip(),
             "success": True,
         }
+        final_scan_result = self._format_final_scan_result(scan_results)
 
-        self.final_scan_result = self._format_final_scan_result(self.scan_results)
-        self.run_record["scan_results"] = self.scan_results
+        with self._lock:
+            self.scan_results = scan_results
+            self.final_scan_result = final_scan_result
+            self.run_record["scan_results"] = scan_results
 
         logger.info("Updated scan final fields")
         self.save_run_data(mark_complete=True)
@@ -265,42 +298,44 @@ class ReportState:
         scarf.end(self, exit_reason="finished_by_tool")
 
     def set_scan_config(self, config: dict[str, Any]) -> None:
-        self.scan_config = config
-        self.run_record["status"] = "running"
-        self.run_record["end_time"] = None
-        self.run_record.pop("scan_results", None)
-        self.end_time = None
-        self.scan_results = None
-        self.final_scan_result = None
-        self.run_record.update(
-            {
-                "targets_info": config.get("targets", []),
-                "instruction": config.get("user_instructions", ""),
-                "scan_mode": config.get("scan_mode", "deep"),
-                "diff_scope": config.get("diff_scope", {"active": False}),
-                "non_interactive": bool(config.get("non_interactive", False)),
-                "local_sources": config.get("local_sources", []),
-                "scope_mode": config.get("scope_mode", "auto"),
-                "diff_base": config.get("diff_base"),
-            }
-        )
+        with self._lock:
+            self.scan_config = config
+            self.run_record["status"] = "running"
+            self.run_record["end_time"] = None
+            self.run_record.pop("scan_results", None)
+            self.end_time = None
+            self.scan_results = None
+            self.final_scan_result = None
+            self.run_record.update(
+                {
+                    "targets_info": config.get("targets", []),
+                    "instruction": config.get("user_instructions", ""),
+                    "scan_mode": config.get("scan_mode", "deep"),
+                    "diff_scope": config.get("diff_scope", {"active": False}),
+                    "non_interactive": bool(config.get("non_interactive", False)),
+                    "local_sources": config.get("local_sources", []),
+                    "scope_mode": config.get("scope_mode", "auto"),
+                    "diff_base": config.get("diff_base"),
+                }
+            )
 
     def save_run_data(self, mark_complete: bool = False, status: str | None = None) -> None:
-        if mark_complete:
-            self.end_time = datetime.now(UTC).isoformat()
-            self.run_record["end_time"] = self.end_time
-            self.run_record["status"] = "completed"
-        elif status and self.run_record.get("status") != "completed":
-            current_status = self.run_record.get("status")
-            if status == "stopped" and current_status in {"failed", "interrupted"}:
-                status = str(current_status)
-            if self.end_time is None:
+        with self._lock:
+            if mark_complete:
                 self.end_time = datetime.now(UTC).isoformat()
-            self.run_record["end_time"] = self.end_time
-            self.run_record["status"] = status
-
-        self._sync_llm_usage_record()
-        self._save_artifacts()
+                self.run_record["end_time"] = self.end_time
+                self.run_record["status"] = "completed"
+            elif status and self.run_record.get("status") != "completed":
+                current_status = self.run_record.get("status")
+                if status == "stopped" and current_status in {"failed", "interrupted"}:
+                    status = str(current_status)
+                if self.end_time is None:
+                    self.end_time = datetime.now(UTC).isoformat()
+                self.run_record["end_time"] = self.end_time
+                self.run_record["status"] = status
+
+            self._sync_llm_usage_record()
+            self._save_artifacts()
 
     def cleanup(self, status: str = "stopped") -> None:
         self.save_run_data(status=status)
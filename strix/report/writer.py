@@ -62,13 +62,20 @@ def write_vulnerabilities(
             render_vulnerability_md(report),
             encoding="utf-8",
         )
-        saved_vuln_ids.add(report["id"])
+
+    # Reports are immutable once recorded, and save_run_data runs after every
+    # LLM usage update, so only rebuild the indexes when something was added.
+    # IDs are marked saved only after both indexes are written, so a failed
+    # index write is retried on the next save instead of leaving them stale.
+    csv_path = run_dir / "vulnerabilities.csv"
+    json_path = run_dir / "vulnerabilities.json"
+    if not new_reports and csv_path.exists() and json_path.exists():
+        return 0
 
     sorted_reports = sorted(
         vulnerability_reports,
         key=lambda r: (_SEVERITY_ORDER.get(r["severity"], 5), r["timestamp"]),
     )
-    csv_path = run_dir / "vulnerabilities.csv"
     with csv_path.open("w", encoding="utf-8", newline="") as f:
         fieldnames = ["id", "title", "severity", "timestamp", "file"]
         writer = csv.DictWriter(f, fieldnames=fieldnames)
@@ -85,9 +92,10 @@ def write_vulnerabilities(
             )
 
     _atomic_write_text(
-        run_dir / "vulnerabilities.json",
+        json_path,
         json.dumps(vulnerability_reports, ensure_ascii=False, indent=2, default=str),
     )
+    saved_vuln_ids.update(r["id"] for r in new_reports)
 
     if new_reports:
         logger.info(
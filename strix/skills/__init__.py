@@ -1,3 +1,4 @@
+import functools
 import logging
 import re
 from collections.abc import Iterator
@@ -12,18 +13,58 @@ _FRONTMATTER_PATTERN = re.compile(r"^---\s*\n.*?\n---\s*\n", re.DOTALL)
 _INTERNAL_SKILL_CATEGORIES: frozenset[str] = frozenset({"scan_modes", "coordination"})
 
 
-def _iter_user_skill_files() -> Iterator[tuple[str, str]]:
-    """Yield ``(category_name, skill_name)`` for every user-selectable skill."""
+# Skill files ship with the package and never change during a run, so the
+# directory walks and file reads below are done once per process.
+
+
+@functools.cache
+def _user_skill_files() -> tuple[tuple[str, str], ...]:
     skills_dir = get_strix_resource_path("skills")
     if not skills_dir.exists():
-        return
+        return ()
+    found: list[tuple[str, str]] = []
     for category_dir in sorted(skills_dir.iterdir()):
         if not category_dir.is_dir() or category_dir.name.startswith("__"):
             continue
         if category_dir.name in _INTERNAL_SKILL_CATEGORIES:
             continue
-        for file_path in sorted(category_dir.glob("*.md")):
-            yield category_dir.name, file_path.stem
+        found.extend((category_dir.name, p.stem) for p in sorted(category_dir.glob("*.md")))
+    return tuple(found)
+
+
+def _iter_user_skill_files() -> Iterator[tuple[str, str]]:
+    """Yield ``(category_name, skill_name)`` for every user-selectable skill."""
+    yield from _user_skill_files()
+
+
+@functools.cache
+def _skill_paths_by_name() -> dict[str, str]:
+    """Map bare skill name -> ``category/name.md`` across every category."""
+    skills_dir = get_strix_resource_path("skills")
+    by_category: dict[str, str] = {}
+    if not skills_dir.exists():
+        return by_category
+    for category_dir in skills_dir.iterdir():
+        if not category_dir.is_dir() or category_dir.name.startswith("__"):
+            continue
+        for file_path in category_dir.glob("*.md"):
+            by_category[file_path.stem] = f"{category_dir.name}/{file_path.stem}.md"
+    return by_category
+
+
+@functools.cache
+def _root_skill_names() -> frozenset[str]:
+    """Bare names of skill files sitting directly under the skills root."""
+    skills_dir = get_strix_resource_path("skills")
+    if not skills_dir.exists():
+        return frozenset()
+    return frozenset(p.stem for p in skills_dir.glob("*.md"))
+
+
+@functools.cache
+def _read_skill_body(rel_path: str) -> str:
+    content = (get_strix_resource_path("skills") / rel_path).read_text(encoding="utf-8")
+    return _FRONTMATTER_PATTERN.sub("", content).lstrip()
 
 
 def get_all_skill_names() -> set[str]:
@@ -69,37 +110,36 @@ def load_skills(skill_names: list[str]) -> dict[str, str]:
     if not skills_dir.exists():
         return {}
 
-    by_category: dict[str, str] = {}
-    for category_dir in skills_dir.iterdir():
-        if not category_dir.is_dir() or category_dir.name.startswith("__"):
-            continue
-        for file_path in category_dir.glob("*.md"):
-            by_category[file_path.stem] = f"{category_dir.name}/{file_path.stem}.md"
+    by_category = _skill_paths_by_name()
 
     skill_content: dict[str, str] = {}
     for skill_name in skill_names:
+        # Bare names resolve against the cached directory listings; only an
+        # explicit ``category/name`` still needs a stat.
         rel_path: str | None
         if "/" in skill_name:
             rel_path = f"{skill_name}.md"
+            if not (skills_dir / rel_path).exists():
+                rel_path = None
         elif skill_name in by_category:
             rel_path = by_category[skill_name]
-        elif (skills_dir / f"{skill_name}.md").exists():
+        elif skill_name in _root_skill_names():
             rel_path = f"{skill_name}.md"
         else:
             rel_path = None
 
-        if rel_path is None or not (skills_dir / rel_path).exists():
+        if rel_path is None:
             logger.warning("Skill not found: %s", skill_name)
             continue
 
         try:
-            content = (skills_dir / rel_path).read_text(encoding="utf-8")
+            body = _read_skill_body(rel_path)
         except (OSError, ValueError) as e:
             logger.warning("Failed to load skill %s: %s", skill_name, e)
             continue
 
         var_name = skill_name.split("/")[-1]
-        skill_content[var_name] = _FRONTMATTER_PATTERN.sub("", content).lstrip()
+        skill_content[var_name] = body
         logger.debug("Loaded skill: %s -> %s", skill_name, var_name)
 
     logger.debug("load_skills: %d skill(s) resolved", len(skill_content))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 import platform
 import sys
@@ -14,8 +15,10 @@ logger = logging.getLogger(__name__)
 SESSION_ID: str = uuid4().hex[:16]
 
 _FIRST_RUN_CACHED: bool | None = None
+_BASE_PROPS_CACHED: dict[str, Any] | None = None
 
 
+@functools.cache
 def get_version() -> str:
     try:
         return version("strix-agent")
@@ -42,9 +45,14 @@ def is_first_run() -> bool:
 
 
 def base_props() -> dict[str, Any]:
-    return {
-        "os": platform.system().lower(),
-        "arch": platform.machine(),
-        "python": f"{sys.version_info.major}.{sys.version_info.minor}",
-        "strix_version": get_version(),
-    }
+    # Every event (one per finding) spreads these; they can't change within a
+    # process, so skip the platform probes and dist-info scan after the first.
+    global _BASE_PROPS_CACHED  # noqa: PLW0603
+    if _BASE_PROPS_CACHED is None:
+        _BASE_PROPS_CACHED = {
+            "os": platform.system().lower(),
+            "arch": platform.machine(),
+            "python": f"{sys.version_info.major}.{sys.version_info.minor}",
+            "strix_version": get_version(),
+        }
+    return dict(_BASE_PROPS_CACHED)
@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 _notes_storage: dict[str, dict[str, Any]] = {}
 _VALID_NOTE_CATEGORIES = ["general", "findings", "methodology", "questions", "plan", "wiki"]
 _notes_lock = threading.RLock()
+# Serializes notes.json writes so a later snapshot is never overwritten by an
+# earlier one; held without _notes_lock so inline reads don't wait on disk.
+_persist_lock = threading.Lock()
 _DEFAULT_CONTENT_PREVIEW_CHARS = 280
 
 _notes_path: Path | None = None
@@ -58,26 +61,26 @@ def hydrate_notes_from_disk(state_dir: Path) -> None:
 
 
 def _persist() -> None:
+    """Write notes.json. Call without holding ``_notes_lock``."""
     path = _notes_path
     if path is None:
         return
     try:
-        payload = json.dumps(_notes_storage, ensure_ascii=False, default=str)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with (
-            _notes_lock,
-            tempfile.NamedTemporaryFile(
+        with _persist_lock:
+            with _notes_lock:
+                payload = json.dumps(_notes_storage, ensure_ascii=False, default=str)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
                 mode="w",
                 encoding="utf-8",
                 dir=str(path.parent),
                 prefix=f".{path.name}.",
                 suffix=".tmp",
                 delete=False,
-            ) as tmp,
-        ):
-            tmp.write(payload)
-            tmp_path = Path(tmp.name)
-        tmp_path.replace(path)
+            ) as tmp:
+                tmp.write(payload)
+                tmp_path = Path(tmp.name)
+            tmp_path.replace(path)
     except Exception:
         logger.exception("notes persist to %s failed", path)
 
@@ -88,15 +91,14 @@ def _filter_notes(
     search_query: str | None = None,
 ) -> list[dict[str, Any]]:
     filtered: list[dict[str, Any]] = []
+    wanted_tags = frozenset(tags) if tags else None
+    search_lower = search_query.lower() if search_query else None
     for note_id, note in _notes_storage.items():
         if category and note.get("category") != category:
             continue
-        if tags:
-            note_tags = note.get("tags", [])
-            if not any(tag in note_tags for tag in tags):
-                continue
-        if search_query:
-            search_lower = search_query.lower()
+        if wanted_tags and wanted_tags.isdisjoint(note.get("tags", [])):
+            continue
+        if search_lower:
             title_match = search_lower in note.get("title", "").lower()
             content_match = search_lower in note.get("content", "").lower()
             if not (title_match or content_match):
@@ -167,14 +169,14 @@ def _create_note_impl(
             _notes_storage[note_id] = note
         except (ValueError, TypeError) as e:
             return {"success": False, "error": f"Failed to create note: {e}", "note_id": None}
-        else:
-            _persist()
-            return {
-                "success": True,
-                "note_id": note_id,
-                "message": f"Note '{title}' created successfully",
-                "total_count": len(_notes_storage),
-            }
+        result = {
+            "success": True,
+            "note_id": note_id,
+            "message": f"Note '{title}' created successfully",
+            "total_count": len(_notes_storage),
+        }
+    _persist()
+    return result
 
 
 def _list_notes_impl(
@@ -247,14 +249,14 @@ def _update_note_impl(
             note["updated_at"] = datetime.now(UTC).isoformat()
         except (ValueError, TypeError) as e:
             return {"success": False, "error": f"Failed to update note: {e}"}
-        else:
-            _persist()
-            return {
-                "success": True,
-                "note_id": note_id,
-                "message": f"Note '{note['title']}' updated successfully",
-                "total_count": len(_notes_storage),
-            }
+        result = {
+            "success": True,
+            "note_id": note_id,
+            "message": f"Note '{note['title']}' updated successfully",
+            "total_count": len(_notes_storage),
+        }
+    _persist()
+    return result
 
 
 def _delete_note_impl(note_id: str) -> dict[str, Any]:
@@ -267,14 +269,14 @@ def _delete_note_impl(note_id: str) -> dict[str, Any]:
             del _notes_storage[note_id]
         except (ValueError, TypeError) as e:
             return {"success": False, "error": f"Failed to delete note: {e}"}
-        else:
-            _persist()
-            return {
-                "success": True,
-                "note_id": note_id,
-                "message": f"Note '{note_title}' deleted successfully",
-                "total_count": len(_notes_storage),
-            }
+        result = {
+            "success": True,
+            "note_id": note_id,
+            "message": f"Note '{note_title}' deleted successfully",
+            "total_count": len(_notes_storage),
+        }
+    _persist()
+    return result
 
 
 @function_tool(timeout=30)
@@ -347,9 +349,10 @@ async def list_notes(
         include_content: When False (default) entries have a preview;
             when True the full ``content`` is included.
     """
+    # Reads only hold _notes_lock, which _persist releases before touching
+    # disk, so they run inline rather than paying a threadpool hop per call.
     return json.dumps(
-        await asyncio.to_thread(
-            _list_notes_impl,
+        _list_notes_impl(
             category=category,
             tags=tags,
             search=search,
@@ -367,9 +370,7 @@ async def get_note(ctx: RunContextWrapper, note_id: str) -> str:
     Args:
         note_id: Note id from ``create_note`` or a ``list_notes`` entry.
     """
-    return json.dumps(
-        await asyncio.to_thread(_get_note_impl, note_id), ensure_ascii=False, default=str
-    )
+    return json.dumps(_get_note_impl(note_id), ensure_ascii=False, default=str)
 
 
 @function_tool(timeout=30)
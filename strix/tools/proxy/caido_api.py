@@ -42,6 +42,9 @@ _SITEMAP_PAGE_SIZE = 30
 
 _DEFAULT_CAIDO_URL = "http://127.0.0.1:48080"
 _CLIENT_CACHE: dict[str, Client] = {}
+# Serializes the first login so concurrent agents share one guest session
+# instead of each logging in and connecting, with all but the last leaking.
+_CLIENT_LOCK = asyncio.Lock()
 _REQ_FIELD_MAP: dict[SortBy, tuple[str, str]] = {
     "timestamp": ("req", "created_at"),
     "host": ("req", "host"),
@@ -66,13 +69,15 @@ def _graphql_url() -> str:
     return f"{base_url}/graphql"
 
 
+_LOGIN_AS_GUEST_BODY = json.dumps(
+    {"query": "mutation { loginAsGuest { token { accessToken } } }"}
+).encode("utf-8")
+
+
 def _login_as_guest() -> str:
-    body = json.dumps({"query": "mutation { loginAsGuest { token { accessToken } } }"}).encode(
-        "utf-8"
-    )
     req = urllib.request.Request(  # noqa: S310
         _graphql_url(),
-        data=body,
+        data=_LOGIN_AS_GUEST_BODY,
         headers={"Content-Type": "application/json"},
         method="POST",
     )
@@ -85,11 +90,14 @@ async def get_client() -> Client:
     if client := _CLIENT_CACHE.get("default"):
         return client
 
-    token = await asyncio.to_thread(_login_as_guest)
-    client = Client(caido_url(), auth=TokenAuthOptions(token=token))
-    await client.connect()
-    _CLIENT_CACHE["default"] = client
-    return client
+    async with _CLIENT_LOCK:
+        if client := _CLIENT_CACHE.get("default"):
+            return client
+        token = await asyncio.to_thread(_login_as_guest)
+        client = Client(caido_url(), auth=TokenAuthOptions(token=token))
+        await client.connect()
+        _CLIENT_CACHE["default"] = client
+        return client
 
 
 async def close_client() -> None:
@@ -243,6 +251,11 @@ def full_url_from_components(
     return f"{scheme}://{host_header}{components['url_path']}"
 
 
+def _parse_cookie_header(header: str) -> dict[str, str]:
+    pairs = (part.partition("=") for part in header.split(";"))
+    return {name.strip(): value.strip() for name, sep, value in pairs if sep}
+
+
 def apply_modifications(
     components: dict[str, Any],
     modifications: dict[str, Any],
@@ -262,12 +275,7 @@ def apply_modifications(
     if "body" in modifications:
         body = modifications["body"]
     if "cookies" in modifications:
-        cookies: dict[str, str] = {}
-        if headers.get("Cookie"):
-            for cookie in headers["Cookie"].split(";"):
-                if "=" in cookie:
-                    k, v = cookie.split("=", 1)
-                    cookies[k.strip()] = v.strip()
+        cookies = _parse_cookie_header(headers.get("Cookie") or "")
         cookies.update(modifications["cookies"])
         headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in cookies.items())
 
@@ -56,7 +56,9 @@ def _to_tool_json(value: Any) -> Any:
     if isinstance(value, datetime):
         return value.isoformat()
     if is_dataclass(value) and not isinstance(value, type):
-        return {k: _to_tool_json(v) for k, v in dataclasses.asdict(value).items()}
+        # Walk fields directly: ``dataclasses.asdict`` would deep-copy the
+        # whole SDK object tree only for us to traverse it a second time.
+        return {f.name: _to_tool_json(getattr(value, f.name)) for f in dataclasses.fields(value)}
     if hasattr(value, "model_dump"):
         return _to_tool_json(value.model_dump())
     if isinstance(value, dict):
@@ -66,21 +68,23 @@ def _to_tool_json(value: Any) -> Any:
     return str(value)
 
 
+# One pre-configured encoder for every tool response. ``json.dumps`` with
+# non-default kwargs builds a fresh JSONEncoder per call, and request/response
+# and sitemap listings are the largest payloads the agents round-trip.
+_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str)
+
+
+def _dumps(value: Any) -> str:
+    return _ENCODER.encode(value)
+
+
 def _no_client() -> str:
-    return json.dumps(
-        {"success": False, "error": "Caido client not available in run context"},
-        ensure_ascii=False,
-        default=str,
-    )
+    return _dumps({"success": False, "error": "Caido client not available in run context"})
 
 
 def _err(name: str, exc: Exception) -> str:
     logger.exception("%s failed", name)
-    return json.dumps(
-        {"success": False, "error": f"{name} failed: {exc}"},
-        ensure_ascii=False,
-        default=str,
-    )
+    return _dumps({"success": False, "error": f"{name} failed: {exc}"})
 
 
 @function_tool(timeout=120)
@@ -192,7 +196,7 @@ async def list_requests(
                 },
             )
 
-        return json.dumps(
+        return _dumps(
             {
                 "success": True,
                 "entries": entries,
@@ -203,8 +207,6 @@ async def list_requests(
                     "end_cursor": connection.page_info.end_cursor,
                 },
             },
-            ensure_ascii=False,
-            default=str,
         )
     except Exception as exc:  # noqa: BLE001
         return _err("list_requests", exc)
@@ -251,11 +253,7 @@ async def view_request(
     try:
         result = await caido_api.get_request_with_client(client, request_id, part=part)
         if result is None:
-            return json.dumps(
-                {"success": False, "error": f"Request {request_id} not found"},
-                ensure_ascii=False,
-                default=str,
-            )
+            return _dumps({"success": False, "error": f"Request {request_id} not found"})
 
         raw_bytes = (
             result.request.raw
@@ -263,28 +261,18 @@ async def view_request(
             else (result.response.raw if result.response is not None else None)
         )
         if raw_bytes is None:
-            return json.dumps(
+            return _dumps(
                 {
                     "success": False,
                     "error": f"No raw {part} for {request_id}",
                 },
-                ensure_ascii=False,
-                default=str,
             )
         content = raw_bytes.decode("utf-8", errors="replace")
 
         if search_pattern:
-            return json.dumps(
-                _format_search_hits(content, search_pattern),
-                ensure_ascii=False,
-                default=str,
-            )
+            return _dumps(_format_search_hits(content, search_pattern))
 
-        return json.dumps(
-            _format_text_page(content, page=page, page_size=page_size),
-            ensure_ascii=False,
-            default=str,
-        )
+        return _dumps(_format_text_page(content, page=page, page_size=page_size))
     except Exception as exc:  # noqa: BLE001
         return _err("view_request", exc)
 
@@ -367,11 +355,7 @@ async def repeat_request(
     try:
         result = await caido_api.get_request_with_client(client, request_id, part="request")
         if result is None or result.request.raw is None:
-            return json.dumps(
-                {"success": False, "error": f"Request {request_id} not found"},
-                ensure_ascii=False,
-                default=str,
-            )
+            return _dumps({"success": False, "error": f"Request {request_id} not found"})
 
         original = result.request
         raw_str = result.request.raw.decode("utf-8", errors="replace")
@@ -401,7 +385,7 @@ def _format_replay_tool_result(replay: dict[str, Any]) -> str:
     }
     if replay.get("error"):
         payload["error"] = replay["error"]
-    return json.dumps(payload, ensure_ascii=False, default=str)
+    return _dumps(payload)
 
 
 @function_tool(timeout=60)
@@ -448,7 +432,7 @@ async def list_sitemap(
             depth=depth,
             page=page,
         )
-        return json.dumps(payload, ensure_ascii=False, default=str)
+        return _dumps(payload)
     except Exception as exc:  # noqa: BLE001
         return _err("list_sitemap", exc)
 
@@ -473,7 +457,7 @@ async def view_sitemap_entry(
         return _no_client()
     try:
         payload = await caido_api.view_sitemap_entry_with_client(client, entry_id)
-        return json.dumps(payload, ensure_ascii=False, default=str)
+        return _dumps(payload)
     except Exception as exc:  # noqa: BLE001
         return _err("view_sitemap_entry", exc)
 
@@ -531,66 +515,42 @@ async def scope_rules(
     try:
         if action == "list":
             scopes = await caido_api.scope_list(client)
-            return json.dumps(
-                {"success": True, "scopes": [_to_tool_json(s) for s in scopes]},
-                ensure_ascii=False,
-                default=str,
-            )
+            return _dumps({"success": True, "scopes": [_to_tool_json(s) for s in scopes]})
         if action == "get":
             if not scope_id:
-                return json.dumps(
-                    {"success": False, "error": "Scope_id is required for action='get'"},
-                    ensure_ascii=False,
-                    default=str,
-                )
+                return _dumps({"success": False, "error": "Scope_id is required for action='get'"})
             scope = await caido_api.scope_get(client, scope_id)
-            return json.dumps(
-                {"success": True, "scope": _to_tool_json(scope)}, ensure_ascii=False, default=str
-            )
+            return _dumps({"success": True, "scope": _to_tool_json(scope)})
         if action == "create":
             if not scope_name:
-                return json.dumps(
+                return _dumps(
                     {"success": False, "error": "Scope_name is required for action='create'"},
-                    ensure_ascii=False,
-                    default=str,
                 )
             scope = await caido_api.scope_create(
                 client, name=scope_name, allowlist=allowlist, denylist=denylist
             )
-            return json.dumps(
-                {"success": True, "scope": _to_tool_json(scope)}, ensure_ascii=False, default=str
-            )
+            return _dumps({"success": True, "scope": _to_tool_json(scope)})
         if action == "update":
             if not scope_id or not scope_name:
-                return json.dumps(
+                return _dumps(
                     {
                         "success": False,
                         "error": "Scope_id and scope_name are required for action='update'",
                     },
-                    ensure_ascii=False,
-                    default=str,
                 )
             scope = await caido_api.scope_update(
                 client, scope_id, name=scope_name, allowlist=allowlist, denylist=denylist
             )
-            return json.dumps(
-                {"success": True, "scope": _to_tool_json(scope)}, ensure_ascii=False, default=str
-            )
+            return _dumps({"success": True, "scope": _to_tool_json(scope)})
         if not scope_id:
-            return json.dumps(
-                {"success": False, "error": "Scope_id is required for action='delete'"},
-                ensure_ascii=False,
-                default=str,
-            )
+            return _dumps({"success": False, "error": "Scope_id is required for action='delete'"})
         await caido_api.scope_delete(client, scope_id)
-        return json.dumps(
+        return _dumps(
             {
                 "success": True,
                 "deleted": scope_id,
                 "message": f"Scope {scope_id} deleted",
             },
-            ensure_ascii=False,
-            default=str,
         )
     except Exception as exc:  # noqa: BLE001
         return _err("scope_rules", exc)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
@@ -36,6 +37,9 @@ _CODE_LOCATION_FIELDS = (
     "fix_after",
 )
 
+_CVE_RE = re.compile(r"CVE-\d{4}-\d{4,}")
+_CWE_RE = re.compile(r"CWE-\d+")
+
 
 def _validate_file_path(path: str) -> str | None:
     if not path or not path.strip():
@@ -98,23 +102,23 @@ def _validate_code_locations(locations: list[dict[str, Any]]) -> list[str]:
 
 
 def _extract_cve(cve: str) -> str:
-    match = re.search(r"CVE-\d{4}-\d{4,}", cve)
+    match = _CVE_RE.search(cve)
     return match.group(0) if match else cve.strip()
 
 
 def _validate_cve(cve: str) -> str | None:
-    if not re.match(r"^CVE-\d{4}-\d{4,}$", cve):
+    if not _CVE_RE.fullmatch(cve):
         return f"invalid CVE format: '{cve}' (expected 'CVE-YYYY-NNNNN')"
     return None
 
 
 def _extract_cwe(cwe: str) -> str:
-    match = re.search(r"CWE-\d+", cwe)
+    match = _CWE_RE.search(cwe)
     return match.group(0) if match else cwe.strip()
 
 
 def _validate_cwe(cwe: str) -> str | None:
-    if not re.match(r"^CWE-\d+$", cwe):
+    if not _CWE_RE.fullmatch(cwe):
         return f"invalid CWE format: '{cwe}' (expected 'CWE-NNN')"
     return None
 
@@ -258,7 +262,10 @@ async def _do_create(  # noqa: PLR0912
                 "reason": dedupe.get("reason", ""),
             }
 
-        report_id = report_state.add_vulnerability_report(
+        # Filing a report rewrites the run artifacts and fires blocking
+        # telemetry POSTs; keep that off the loop the other agents share.
+        report_id = await asyncio.to_thread(
+            report_state.add_vulnerability_report,
             title=title,
             description=description,
             severity=severity,
@@ -228,6 +228,8 @@ def _apply_single_update(
     description: str | None = None,
     priority: str | None = None,
     status: str | None = None,
+    *,
+    timestamp: str,
 ) -> dict[str, Any] | None:
     if todo_id not in agent_todos:
         return {"todo_id": todo_id, "error": f"Todo with ID '{todo_id}' not found"}
@@ -251,8 +253,8 @@ def _apply_single_update(
                 "error": f"Invalid status. Must be one of: {', '.join(VALID_STATUSES)}",
             }
         todo["status"] = status_candidate
-        todo["completed_at"] = datetime.now(UTC).isoformat() if status_candidate == "done" else None
-    todo["updated_at"] = datetime.now(UTC).isoformat()
+        todo["completed_at"] = timestamp if status_candidate == "done" else None
+    todo["updated_at"] = timestamp
     return None
 
 
@@ -303,10 +305,10 @@ async def create_todo(ctx: RunContextWrapper, todos: str) -> str:
 
         agent_todos = _get_agent_todos(agent_id)
         created: list[dict[str, Any]] = []
+        timestamp = datetime.now(UTC).isoformat()
         for task in tasks:
             task_priority = _normalize_priority(task.get("priority"))
             todo_id = str(uuid.uuid4())[:6]
-            timestamp = datetime.now(UTC).isoformat()
             agent_todos[todo_id] = {
                 "title": task["title"],
                 "description": task.get("description"),
@@ -445,6 +447,7 @@ async def update_todo(ctx: RunContextWrapper, updates: str) -> str:
 
         updated: list[str] = []
         errors: list[dict[str, Any]] = []
+        timestamp = datetime.now(UTC).isoformat()
         for upd in updates_to_apply:
             err = _apply_single_update(
                 agent_todos,
@@ -453,6 +456,7 @@ async def update_todo(ctx: RunContextWrapper, updates: str) -> str:
                 upd.get("description"),
                 upd.get("priority"),
                 upd.get("status"),
+                timestamp=timestamp,
             )
             if err:
                 errors.append(err)
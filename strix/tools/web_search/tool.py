@@ -5,6 +5,8 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import threading
+from http.cookiejar import DefaultCookiePolicy
 from typing import Any
 
 import requests
@@ -41,6 +43,29 @@ Structure your response to be comprehensive yet concise, emphasizing the most cr
 security implications and details."""
 
 
+_PERPLEXITY_URL = "https://api.perplexity.ai/chat/completions"
+# (connect, read): an unreachable endpoint fails fast, while sonar-reasoning-pro
+# still gets the full five minutes to produce its answer.
+_REQUEST_TIMEOUT = (10, 300)
+
+
+_thread_local = threading.local()
+
+
+def _http_session() -> requests.Session:
+    # Searches run on the default executor's worker threads, and a
+    # requests.Session isn't safe to share between threads. Each worker keeps
+    # its own keep-alive connection to Perplexity instead. The API is
+    # bearer-authenticated, so cookies are refused rather than carried from
+    # one agent's search into another's.
+    session: requests.Session | None = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _thread_local.session = session
+    return session
+
+
 def _do_search(query: str) -> dict[str, Any]:  # noqa: PLR0911 - each error class needs its own sanitized return
     if not query or not query.strip():
         return {"success": False, "error": "Query cannot be empty"}
@@ -57,7 +82,6 @@ def _do_search(query: str) -> dict[str, Any]:  # noqa: PLR0911 - each error clas
         }
     logger.info("web_search query (len=%d): %s", len(query), query[:120])
 
-    url = "https://api.perplexity.ai/chat/completions"
     headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
     payload = {
         "model": "sonar-reasoning-pro",
@@ -68,7 +92,9 @@ def _do_search(query: str) -> dict[str, Any]:  # noqa: PLR0911 - each error clas
     }
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=300)
+        response = _http_session().post(
+            _PERPLEXITY_URL, headers=headers, json=payload, timeout=_REQUEST_TIMEOUT
+        )
         response.raise_for_status()
         content = response.json()["choices"][0]["message"]["content"]
     except requests.exceptions.Timeout:
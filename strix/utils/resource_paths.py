@@ -1,13 +1,20 @@
+import functools
 import sys
 from pathlib import Path
 
 
-def get_strix_resource_path(*parts: str) -> Path:
+@functools.cache
+def _resource_base() -> Path:
+    # Resolved once per process: the frozen bundle / package location can't
+    # move underneath us, and callers hit this on every prompt render.
     frozen_base = getattr(sys, "_MEIPASS", None)
     if frozen_base:
         base = Path(frozen_base) / "strix"
         if base.exists():
-            return base.joinpath(*parts)
+            return base
+
+    return Path(__file__).resolve().parent.parent
 
-    base = Path(__file__).resolve().parent.parent
-    return base.joinpath(*parts)
+
+def get_strix_resource_path(*parts: str) -> Path:
+    return _resource_base().joinpath(*parts)
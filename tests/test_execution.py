@@ -1,14 +1,19 @@
-"""Tests for the scan-wide budget-stop signal on the agent coordinator."""
+"""Tests for the agent coordinator's stop signals (budget stop, subtree stop)."""
 
 from __future__ import annotations
 
 import asyncio
+from typing import TYPE_CHECKING
 
 import pytest
 
 from strix.core.agents import AgentCoordinator
 
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
 @pytest.mark.asyncio
 async def test_budget_stop_sets_flag() -> None:
     coordinator = AgentCoordinator()
@@ -42,3 +47,47 @@ async def test_wait_for_message_returns_immediately_after_budget_stop() -> None:
 
     # No pending messages, but the stop flag short-circuits the wait.
     await asyncio.wait_for(coordinator.wait_for_message("agent"), timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_graceful_cancel_stops_whole_subtree_with_one_snapshot(tmp_path: Path) -> None:
+    coordinator = AgentCoordinator()
+    await coordinator.register("root", "strix", parent_id=None)
+    await coordinator.register("child", "recon", parent_id="root")
+    await coordinator.register("grandchild", "sqli", parent_id="child")
+    await coordinator.register("sibling", "xss", parent_id=None)
+
+    writes = 0
+    original = coordinator.snapshot
+
+    async def counting_snapshot() -> dict[str, object]:
+        nonlocal writes
+        writes += 1
+        return await original()
+
+    coordinator.snapshot = counting_snapshot  # type: ignore[method-assign]
+    coordinator.set_snapshot_path(tmp_path / "agents.json")
+
+    await coordinator.cancel_descendants_graceful("root")
+
+    assert coordinator.statuses["root"] == "stopped"
+    assert coordinator.statuses["child"] == "stopped"
+    assert coordinator.statuses["grandchild"] == "stopped"
+    assert coordinator.statuses["sibling"] == "running"
+    assert writes == 1
+
+
+@pytest.mark.asyncio
+async def test_unchanged_graph_is_not_rewritten(tmp_path: Path) -> None:
+    snapshot_path = tmp_path / "agents.json"
+    coordinator = AgentCoordinator()
+    coordinator.set_snapshot_path(snapshot_path)
+    await coordinator.register("root", "strix", parent_id=None)
+    assert snapshot_path.exists()
+
+    snapshot_path.unlink()
+    await coordinator.mark_running("root")  # already running: nothing changed
+    assert not snapshot_path.exists()
+
+    await coordinator.set_status("root", "completed")
+    assert snapshot_path.exists()
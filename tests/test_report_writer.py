@@ -0,0 +1,60 @@
+"""Tests for write_vulnerabilities: index skipping and recovery after failures."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from strix.report.writer import write_vulnerabilities
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _report(report_id: str, severity: str = "high") -> dict[str, Any]:
+    return {
+        "id": report_id,
+        "title": f"Finding {report_id}",
+        "severity": severity,
+        "timestamp": "2026-01-01 00:00:00 UTC",
+    }
+
+
+def test_indexes_are_not_rewritten_without_new_reports(tmp_path: Path) -> None:
+    reports = [_report("vuln-0001")]
+    saved: set[str] = set()
+
+    assert write_vulnerabilities(tmp_path, reports, saved) == 1
+    assert saved == {"vuln-0001"}
+
+    json_path = tmp_path / "vulnerabilities.json"
+    json_path.write_text("sentinel", encoding="utf-8")
+
+    assert write_vulnerabilities(tmp_path, reports, saved) == 0
+    assert json_path.read_text(encoding="utf-8") == "sentinel"
+
+
+def test_failed_index_write_is_retried_on_next_save(tmp_path: Path) -> None:
+    reports = [_report("vuln-0001")]
+    saved: set[str] = set()
+
+    # A directory in the CSV's place makes the index write raise OSError.
+    csv_path = tmp_path / "vulnerabilities.csv"
+    csv_path.mkdir()
+    with pytest.raises(OSError):
+        write_vulnerabilities(tmp_path, reports, saved)
+    assert saved == set()
+
+    shutil.rmtree(csv_path)
+    (tmp_path / "vulnerabilities.json").write_text("[]", encoding="utf-8")
+    csv_path.write_text("", encoding="utf-8")
+
+    assert write_vulnerabilities(tmp_path, reports, saved) == 1
+    assert saved == {"vuln-0001"}
+    data = json.loads((tmp_path / "vulnerabilities.json").read_text(encoding="utf-8"))
+    assert [r["id"] for r in data] == ["vuln-0001"]
+    assert "vuln-0001" in csv_path.read_text(encoding="utf-8")